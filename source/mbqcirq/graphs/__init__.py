@@ -5,10 +5,8 @@
 #####   Libraries
 #################
 import abc
+import functools
 
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
 import networkx as nx
 
 from abc import ABC
@@ -16,6 +14,18 @@ from abc import ABC
 from typing import Literal, Optional
 
 
+#################
+#####   Constants
+#################
+
+
+_LAYOUT_DISPATCH = {
+    'spring': functools.partial(nx.spring_layout, seed=42),
+    'planar': nx.planar_layout,
+}
+"""networkx layout functions used by Graph.plot, keyed by layout name."""
+
+
 ########################
 #####   Abstract Classes
 ########################
@@ -23,11 +33,24 @@ from typing import Literal, Optional
 
 class GraphDescription:
     """Description of the basic properties of a graph."""
-    is_grid: Optional[bool] = None
-    """If the graph is a 2d grid or not."""
-    dimension: Optional[int] = None
-    """The dimension of the space in which the graph has a meaningful 
-    intepretation."""
+
+    __slots__ = ('is_grid', 'dimension')
+
+    def __init__(
+            self,
+            is_grid: Optional[bool] = None,
+            dimension: Optional[int] = None
+    ) -> None:
+        """Initialize graph description.
+
+        :param is_grid: If the graph is a 2d grid or not.
+        :type is_grid: Optional[bool]
+        :param dimension: The dimension of the space in which the graph has
+            a meaningful intepretation.
+        :type dimension: Optional[int]
+        """
+        self.is_grid = is_grid
+        self.dimension = dimension
 
 
 class Graph(ABC):
@@ -36,6 +59,7 @@ class Graph(ABC):
     def __init__(self):
         """Initialize graph."""
         self._description = GraphDescription()
+        self._layout_cache = {}
 
     @abc.abstractmethod
     def _setup(self):
@@ -55,29 +79,42 @@ class Graph(ABC):
 
     @property
     def nodes(self):
-        """Get graph nodes."""
+        """Get graph nodes, as a live networkx ``NodeView`` of the
+        underlying graph.
+
+        Indexing the view looks up node attributes (``nodes[v]`` returns the
+        attribute dict of node ``v``); use :attr:`nodes_list` for positional
+        access.
+        """
+        return self.graph.nodes
+
+    @property
+    def nodes_list(self) -> list:
+        """Get graph nodes as a list, in the graph's iteration order."""
         return list(self.graph.nodes)
 
     @property
     def edges(self):
-        """Get graph edges."""
+        """Get graph edges, as a live networkx ``EdgeView`` of the
+        underlying graph.
+
+        Use :attr:`edges_list` for positional access.
+        """
+        return self.graph.edges
+
+    @property
+    def edges_list(self) -> list:
+        """Get graph edges as a list, in the graph's iteration order."""
         return list(self.graph.edges)
 
     def get_neighborhood(self, node):
         """Get nearest neighborhood of a given node."""
         return nx.neighbors(self.graph, node)
 
-    def _regular_layout(self) -> None:
+    def _regular_layout(self) -> dict:
         """Compute node positions for plotting in case of regular graphs."""
-        pos = {}
-        for v in self.graph.nodes:
-            if isinstance(v, tuple):
-                pos.update({v: v})
-
-            elif isinstance(v, int):
-                pos.update({v: (0.333333, v)})
-
-        return pos
+        return {v: v if isinstance(v, tuple) else (0.333333, v)
+                for v in self.graph.nodes if isinstance(v, (tuple, int))}
 
     def plot(
             self, layout: Literal['regular', 'planar', 'spring'] = 'regular'
@@ -88,14 +125,21 @@ class Graph(ABC):
             plot.
         :type layout: Literal['regular', 'planar', 'spring']
         """
-        if layout == 'spring':
-            pos = nx.spring_layout(self.graph, seed=42)
+        # Imported here so that building graphs does not load a GUI backend.
+        import matplotlib.pyplot as plt
 
-        elif layout == 'planar':
-            pos = nx.planar_layout(self.graph)
+        layout_fn = _LAYOUT_DISPATCH.get(layout)
+        if layout_fn is None:
+            pos = self._regular_layout()
 
         else:
-            pos = self._regular_layout()
+            # Cached positions are reused only for the same nodes and edges.
+            graph_key = (frozenset(self.graph.nodes),
+                         frozenset(map(frozenset, self.graph.edges)))
+            cached_key, pos = self._layout_cache.get(layout, (None, None))
+            if cached_key != graph_key:
+                pos = layout_fn(self.graph)
+                self._layout_cache[layout] = (graph_key, pos)
 
         plt.figure()
         nx.draw(self.graph, pos, node_color="tab:green", with_labels=True)
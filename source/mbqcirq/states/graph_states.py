@@ -2,8 +2,10 @@
 
 
 import cirq
-import qsimcirq
 import abc
+import weakref
+
+import numpy as np
 
 from mbqcirq.graphs import Graph
 
@@ -12,6 +14,71 @@ from abc import ABC
 from typing import Union, Tuple, List
 
 
+#################
+#####   Constants
+#################
+
+
+_STATE_VECTORS = weakref.WeakValueDictionary()
+"""State vectors of the live graph states, keyed by their structure."""
+
+
+#################
+#####   Functions
+#################
+
+
+def _graph_state_vector(
+        n_qubits: int, edge_shifts: Tuple[Tuple[int, int], ...]
+) -> np.ndarray:
+    r"""Compute the state vector of a graph state.
+
+    The amplitude of the basis state :math:`|x\rangle` is
+    :math:`2^{-n/2} (-1)^{q(x)}`, where :math:`q(x)` is the number of edges
+    whose two qubits are both 1 in :math:`x`.
+
+    Live graph states with the same structure share the same (read-only)
+    array; an array is dropped from the cache together with its last user.
+
+    :param n_qubits: Number of qubits of the state.
+    :type n_qubits: int
+    :param edge_shifts: Edges of the graph, given as the bit positions of
+        their two qubits in the basis-state index.
+    :type edge_shifts: Tuple[Tuple[int, int], ...]
+    :return: The state vector.
+    :rtype: np.ndarray
+    """
+    key = (n_qubits, edge_shifts)
+    state_vector = _STATE_VECTORS.get(key)
+    if state_vector is not None:
+        return state_vector
+
+    # Edges grouped by their most significant qubit.
+    lower_shifts = [[] for _ in range(n_qubits)]
+    for shift1, shift2 in edge_shifts:
+        lower_shifts[max(shift1, shift2)].append(min(shift1, shift2))
+
+    # Build the vector one qubit at a time, from the least significant bit:
+    # the half where the new qubit is 1 copies the current amplitudes and
+    # flips the sign wherever an already added neighbour is 1 too.
+    state_vector = np.empty(1 << n_qubits, dtype=np.complex64)
+    state_vector[0] = 1 / np.sqrt(1 << n_qubits)
+    for shift in range(n_qubits):
+        size = 1 << shift
+        upper_half = state_vector[size:2 * size]
+        upper_half[:] = state_vector[:size]
+        for lower_shift in lower_shifts[shift]:
+            flipped = upper_half.reshape(
+                size >> (lower_shift + 1), 2, 1 << lower_shift
+            )[:, 1, :]
+            np.negative(flipped, out=flipped)
+
+    state_vector.flags.writeable = False
+    _STATE_VECTORS[key] = state_vector
+
+    return state_vector
+
+
 ###############
 #####   Classes
 ###############
@@ -25,6 +92,7 @@ class AbstractGraphState(ABC):
 
         self._graph = None
         self._qubits = None
+        self._node_to_idx = None
         self._initialization_circuit = None
         self._state_vector = None
 
@@ -51,6 +119,10 @@ class AbstractGraphState(ABC):
         else:
             raise NotImplemented
 
+        self._node_to_idx = {
+            node: idx for idx, node in enumerate(self._graph.nodes)
+        }
+
     @property
     def qubits(self):
         """List of cubits of the state."""
@@ -58,15 +130,15 @@ class AbstractGraphState(ABC):
 
     def _produce_initialization_circuit(self) -> None:
         """Initialization circuit for a graph state."""
-        self._initialization_circuit = cirq.Circuit()
-        for qubit in self._qubits:
-            self._initialization_circuit.append(cirq.H(qubit))
+        qubits = self._qubits
+        node_to_idx = self._node_to_idx
 
-        for edge in self._graph.edges:
-            n1, n2 = edge
-            qubit1 = self._qubits[self._graph.nodes.index(n1)]
-            qubit2 = self._qubits[self._graph.nodes.index(n2)]
-            self._initialization_circuit.append(cirq.CZ(qubit1, qubit2))
+        self._initialization_circuit = cirq.Circuit()
+        self._initialization_circuit.append(cirq.H.on_each(qubits))
+        self._initialization_circuit.append(
+            cirq.CZ(qubits[node_to_idx[n1]], qubits[node_to_idx[n2]])
+            for n1, n2 in self._graph.edges
+        )
 
     @property
     def initialization_circuit(self):
@@ -77,16 +149,33 @@ class AbstractGraphState(ABC):
         return self._initialization_circuit
 
     def _compute_state_vector(self) -> None:
-        """Compute the state vector by simulating the initialization
+        """Compute the state vector analytically from the graph.
+
+        Amplitudes follow Cirq's default (sorted, big-endian) qubit order,
+        i.e. the same ordering obtained by simulating the initialization
         circuit.
         """
-        sim = qsimcirq.QSimSimulator()
-        res = sim.simulate(self._initialization_circuit)
-        self._state_vector = res.final_state_vector
+        n_qubits = len(self._qubits)
+        ordered_qubits = cirq.QubitOrder.DEFAULT.order_for(self._qubits)
+        shifts = {
+            qubit: n_qubits - 1 - pos
+            for pos, qubit in enumerate(ordered_qubits)
+        }
+        edge_shifts = tuple(
+            (shifts[self._qubits[self._node_to_idx[n1]]],
+             shifts[self._qubits[self._node_to_idx[n2]]])
+            for n1, n2 in self._graph.edges
+        )
+        self._state_vector = _graph_state_vector(n_qubits, edge_shifts)
 
     @property
     def state_vector(self):
-        """State vector of the cluster state."""
+        """State vector of the cluster state, as a read-only ``np.complex64``
+        array.
+
+        The array is shared with every other live state of the same graph
+        structure, and is only kept in memory while such a state exists.
+        """
         return self._state_vector
 
     def get_qubit(self,  *args) -> Union[cirq.LineQubit, cirq.GridQubit]:
@@ -97,11 +186,12 @@ class AbstractGraphState(ABC):
         :return: The selected qubit.
         :rtype: Union[cirq.LineQubit, cirq.GridQubit]
         """
-        if len(args) == 1:
-            idx = self._graph.nodes.index(*args)
+        node = args[0] if len(args) == 1 else args
+        try:
+            idx = self._node_to_idx[node]
 
-        if len(args) == 2:
-            idx = self._graph.nodes.index(args)
+        except KeyError:
+            raise ValueError(f'{node} is not a node of the graph') from None
 
         return self._qubits[idx]
 